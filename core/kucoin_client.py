@@ -1,9 +1,29 @@
+import asyncio
 import ccxt
+import ccxt.async_support as ccxt_async
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # numba is optional; _streak_len falls back to NumPy.
+    njit = None
 import sys
 import os
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util import Retry
 import time
+import json
+import logging
 import pickle
+import shutil
+import sqlite3
+import msgpack
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from heapq import nlargest
+from operator import itemgetter
 from datetime import datetime, timezone, timedelta
 
 try:
@@ -12,16 +32,120 @@ except ImportError:
     print("Error: 'config/api_key.py' not found or is missing required variables.")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 ASSET_CACHE_DIR = 'cache'
 ICON_CACHE_DIR = os.path.join(ASSET_CACHE_DIR, 'icons')
-ASSET_DETAILS_FILE = os.path.join(ASSET_CACHE_DIR, 'asset_details.pkl')
-COINGECKO_MAP_FILE = os.path.join(ASSET_CACHE_DIR, 'coingecko_map.pkl')
+ASSET_DETAILS_FILE = os.path.join(ASSET_CACHE_DIR, 'asset_details.msgpack')
+MARKETS_CACHE_FILE = os.path.join(ASSET_CACHE_DIR, 'kucoin_markets.json')
+MARKETS_CACHE_TTL = 24 * 60 * 60
+COINGECKO_DB_FILE = os.path.join(ASSET_CACHE_DIR, 'coingecko_map.sqlite')
+# Caches written by older versions; migrated on first load.
+LEGACY_ASSET_DETAILS_FILE = os.path.join(ASSET_CACHE_DIR, 'asset_details.pkl')
+COINGECKO_MAP_FILE = os.path.join(ASSET_CACHE_DIR, 'coingecko_map.msgpack')
+LEGACY_COINGECKO_MAP_FILE = os.path.join(ASSET_CACHE_DIR, 'coingecko_map.pkl')
+# CoinGecko's free tier allows roughly 30 calls/minute; stay a little below it.
+COINGECKO_RATE_LIMIT = (25, 60)
+COINGECKO_MARKETS_PAGE = 250
+ICON_FETCH_WORKERS = 4
+# Persist asset metadata after this many new icons, so an interrupted backfill keeps its progress.
+ASSET_CHECKPOINT_EVERY = 5
+# Closed candles fetched per streak count; also the largest streak that can be reported.
+STREAK_WINDOW = 20
+# Max in-flight OHLCV requests per scan; CCXT's rate limiter still spaces them out.
+SCAN_CONCURRENCY = 8
+
+def _read_cache_file(path, legacy_path=None):
+    """Loads a msgpack cache file, migrating a legacy pickle file if needed. Returns None if neither exists."""
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return msgpack.unpackb(f.read(), raw=False)
+    if legacy_path and os.path.exists(legacy_path):
+        with open(legacy_path, 'rb') as f:
+            data = pickle.load(f)
+        _write_cache_file(path, data)
+        os.remove(legacy_path)
+        return data
+    return None
+
+def _write_cache_file(path, data):
+    # Write to a sibling temp file and swap it in, so an interrupted write never truncates the cache.
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(msgpack.packb(data, use_bin_type=True))
+    os.replace(tmp_path, path)
+
+if njit is not None:
+    @njit(cache=True)
+    def _streak_len(opens, closes):
+        """Length and direction (1 green, -1 red) of the trailing run of same-colored candles."""
+        n = closes.shape[0]
+        if n == 0:
+            return 0, 0
+        green = closes[n - 1] >= opens[n - 1]
+        count = 0
+        for i in range(n - 1, -1, -1):
+            if (closes[i] >= opens[i]) != green:
+                break
+            count += 1
+        return count, 1 if green else -1
+else:
+    def _streak_len(opens, closes):
+        """Length and direction (1 green, -1 red) of the trailing run of same-colored candles."""
+        if not len(closes):
+            return 0, 0
+        rev = (closes >= opens)[::-1]
+        # argmin of the match mask is the first candle whose color breaks the streak;
+        # it is 0 only when every candle matches.
+        first_diff = int(np.argmin(rev == rev[0]))
+        return (first_diff if first_diff else len(rev)), (1 if rev[0] else -1)
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing `calls` acquisitions per `period` seconds."""
+    def __init__(self, calls, period):
+        self.capacity = calls
+        self.rate = calls / period
+        self.tokens = float(calls)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
 
 class KuCoinClient:
-    def __init__(self):
+    def __init__(self, tickers_ttl=30):
+        """tickers_ttl: seconds a fetch_tickers snapshot is reused by fetch_top_volumes."""
         self.client = None
-        self.asset_details = self._load_local_asset_cache()
-        self.coingecko_map = {}
+        # Asset metadata is kept as flat per-field lookups for the desktop paint path; an icon
+        # whose file is gone is stored as None here rather than checked on every lookup.
+        asset_details = self._load_local_asset_cache()
+        icon_files = set(os.listdir(ICON_CACHE_DIR)) if os.path.isdir(ICON_CACHE_DIR) else set()
+        self._asset_name = {code: d.get('name') or code for code, d in asset_details.items()}
+        self._asset_icon = {
+            code: d['icon_path'] if d.get('icon_path') and os.path.basename(d['icon_path']) in icon_files else None
+            for code, d in asset_details.items()
+        }
+        self._cg_lock = threading.Lock()
+        self._cg_db = None  # opened on first need by _coingecko_map_is_loaded
+        self._cg_id_cache = {}  # code -> CoinGecko id (or None), filled by _coingecko_id
+        self._tickers_cache = None
+        self._tickers_cache_time = 0
+        self._tickers_ttl = tickers_ttl
+        self._ohlcv_cache = {}  # (symbol, timeframe) -> (fetch_ms, ohlcv)
+        self._asset_lock = threading.Lock()
+        self._coingecko_limiter = _RateLimiter(*COINGECKO_RATE_LIMIT)
+        self._http = requests.Session()
+        retry = Retry(total=3, backoff_factor=1.5, status_forcelist=[429, 500, 502, 503, 504])
+        self._http.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
         if not all([API_KEY, API_SECRET, API_PASSWORD]) or "HERE" in API_KEY:
             sys.exit("Error: Credentials in 'config/api_key.py' are incomplete.")
         try:
@@ -29,163 +153,361 @@ class KuCoinClient:
                 'apiKey': API_KEY, 'secret': API_SECRET, 'password': API_PASSWORD,
             })
             print("Successfully connected to the KuCoin Futures API.")
+            # Compile (or load the cached build of) the streak kernel now rather than during the first scan.
+            _streak_len(np.zeros(2), np.zeros(2))
         except Exception as e:
             sys.exit(f"An error occurred during KuCoin client initialization: {e}")
+        self._load_markets()
+
+    def _load_markets(self):
+        """Loads CCXT markets from the disk cache when fresh, otherwise from KuCoin, refreshing the cache."""
+        try:
+            if os.path.exists(MARKETS_CACHE_FILE) and time.time() - os.path.getmtime(MARKETS_CACHE_FILE) < MARKETS_CACHE_TTL:
+                with open(MARKETS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                self.client.set_markets(cached['markets'], cached.get('currencies'))
+                return
+        except Exception as e:
+            print(f"Warning: Could not load markets cache: {e}.")
+        try:
+            self.client.load_markets()
+            os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+            tmp_path = MARKETS_CACHE_FILE + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'markets': list(self.client.markets.values()), 'currencies': self.client.currencies}, f)
+            os.replace(tmp_path, MARKETS_CACHE_FILE)
+        except Exception as e:
+            # CCXT falls back to loading markets lazily on the first request.
+            print(f"Warning: Could not load KuCoin markets: {e}.")
 
     def _load_local_asset_cache(self):
-        if os.path.exists(ASSET_DETAILS_FILE):
-            try:
-                with open(ASSET_DETAILS_FILE, 'rb') as f:
-                    return pickle.load(f)
-            except Exception as e:
-                print(f"Warning: Could not load asset cache: {e}.")
+        try:
+            return _read_cache_file(ASSET_DETAILS_FILE, LEGACY_ASSET_DETAILS_FILE) or {}
+        except Exception as e:
+            print(f"Warning: Could not load asset cache: {e}.")
         return {}
 
+    def _open_coingecko_db(self):
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        # Also used from the scan worker thread; every access goes through _cg_lock.
+        db = sqlite3.connect(COINGECKO_DB_FILE, check_same_thread=False)
+        db.execute("CREATE TABLE IF NOT EXISTS m(symbol TEXT PRIMARY KEY, id TEXT)")
+        return db
+
+    def _coingecko_map_is_loaded(self):
+        with self._cg_lock:
+            if self._cg_db is None:
+                self._cg_db = self._open_coingecko_db()
+            return self._cg_db.execute("SELECT 1 FROM m LIMIT 1").fetchone() is not None
+
+    def _store_coingecko_map(self, rows):
+        with self._cg_lock, self._cg_db:
+            self._cg_db.executemany("INSERT OR REPLACE INTO m(symbol, id) VALUES (?, ?)", rows)
+            self._cg_id_cache.clear()
+
+    def _coingecko_id(self, code):
+        with self._cg_lock:
+            if code not in self._cg_id_cache:
+                row = self._cg_db.execute("SELECT id FROM m WHERE symbol=?", (code.lower(),)).fetchone()
+                self._cg_id_cache[code] = row[0] if row else None
+            return self._cg_id_cache[code]
+
+    def _fetch_coingecko_markets(self, coingecko_ids, _log):
+        """Returns {coingecko_id: /coins/markets row}, requesting up to COINGECKO_MARKETS_PAGE ids per call."""
+        coins = {}
+        ids = sorted(coingecko_ids)
+        for start in range(0, len(ids), COINGECKO_MARKETS_PAGE):
+            page = ids[start:start + COINGECKO_MARKETS_PAGE]
+            try:
+                self._coingecko_limiter.acquire()
+                response = self._http.get(
+                    "https://api.coingecko.com/api/v3/coins/markets",
+                    params={"vs_currency": "usd", "ids": ",".join(page), "per_page": COINGECKO_MARKETS_PAGE},
+                    timeout=30,
+                )
+                response.raise_for_status()
+                for coin in response.json():
+                    coins[coin['id']] = coin
+            except requests.exceptions.RequestException as e:
+                # The session adapter has already retried 429/5xx responses with backoff.
+                _log(f"    Could not fetch CoinGecko market data: {e}. Using fallback data.")
+        return coins
+
+    def _save_asset_details(self):
+        with self._asset_lock:
+            snapshot = {code: {'name': name, 'icon_path': self._asset_icon.get(code)}
+                        for code, name in self._asset_name.items()}
+        _write_cache_file(ASSET_DETAILS_FILE, snapshot)
+
+    def asset_name(self, symbol_string):
+        base_currency = symbol_string.partition('/')[0]
+        return self._asset_name.get(base_currency, base_currency)
+
+    def asset_icon(self, symbol_string):
+        """Path of the cached icon for the symbol's base currency, or None."""
+        return self._asset_icon.get(symbol_string.partition('/')[0])
+
+    def asset_icon_paths(self):
+        return [path for path in self._asset_icon.values() if path]
+
     def get_asset_details(self, symbol_string):
-        try:
-            base_currency = symbol_string.split('/')[0]
-            return self.asset_details.get(base_currency, {'name': base_currency, 'icon_path': None})
-        except Exception:
-            return {'name': symbol_string, 'icon_path': None}
+        return {'name': self.asset_name(symbol_string), 'icon_path': self.asset_icon(symbol_string)}
     
     def ensure_asset_details_are_loaded(self, top_symbols: list, log_callback=None):
         def _log(message):
             if log_callback: log_callback(message)
-        base_currencies_to_check = {s.split('/')[0] for s in top_symbols}
-        missing_currencies = [
-            c for c in base_currencies_to_check 
-            if not self.asset_details.get(c) or not self.asset_details[c].get('icon_path') or not os.path.exists(self.asset_details[c]['icon_path'])
-        ]
+        base_currencies_to_check = {s.partition('/')[0] for s in top_symbols}
+        missing_currencies = [c for c in base_currencies_to_check if self._asset_icon.get(c) is None]
         if not missing_currencies:
             return
         _log(f"Found {len(missing_currencies)} new or missing assets. Fetching details...")
-        if not self.coingecko_map:
-            if os.path.exists(COINGECKO_MAP_FILE):
-                with open(COINGECKO_MAP_FILE, 'rb') as f:
-                    self.coingecko_map = pickle.load(f)
+        if not self._coingecko_map_is_loaded():
+            legacy_map = None
+            try:
+                legacy_map = _read_cache_file(COINGECKO_MAP_FILE, LEGACY_COINGECKO_MAP_FILE)
+            except Exception as e:
+                _log(f"Warning: Could not load legacy CoinGecko ID map: {e}.")
+            if legacy_map:
+                self._store_coingecko_map(legacy_map.items())
+                os.remove(COINGECKO_MAP_FILE)
             else:
                 _log("Fetching CoinGecko ID map (one-time operation)...")
                 try:
-                    os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
-                    response = requests.get("https://api.coingecko.com/api/v3/coins/list", timeout=30)
+                    response = self._http.get("https://api.coingecko.com/api/v3/coins/list", timeout=30)
                     response.raise_for_status()
-                    for coin in response.json():
-                        self.coingecko_map[coin['symbol']] = coin['id']
-                    with open(COINGECKO_MAP_FILE, 'wb') as f:
-                        pickle.dump(self.coingecko_map, f)
+                    self._store_coingecko_map((coin['symbol'], coin['id']) for coin in response.json())
                 except Exception as e:
                     _log(f"Fatal Error: Could not fetch CoinGecko ID map: {e}")
                     return
         os.makedirs(ICON_CACHE_DIR, exist_ok=True)
-        for i, code in enumerate(missing_currencies):
-            _log(f"  -> Fetching Icon & Name [{i+1}/{len(missing_currencies)}]: {code}")
-            coingecko_id = self.coingecko_map.get(code.lower())
-            if not coingecko_id:
-                self.asset_details[code] = {'name': code, 'icon_path': None}
-                continue
-            max_retries = 3
-            success = False
-            for attempt in range(max_retries):
+
+        coingecko_ids = {code: self._coingecko_id(code) for code in missing_currencies}
+        coins = self._fetch_coingecko_markets({i for i in coingecko_ids.values() if i}, _log)
+
+        def _fetch_one(code):
+            coin = coins.get(coingecko_ids[code])
+            if not coin:
+                return code, None
+            name = coin.get('name') or code
+            # /coins/markets links the large image; the small variant is all the table needs.
+            icon_url = coin.get('image')
+            icon_path = None
+            if icon_url:
                 try:
-                    time.sleep(1.2)
-                    coin_url = f"https://api.coingecko.com/api/v3/coins/{coingecko_id}"
-                    coin_response = requests.get(coin_url, timeout=10)
-                    if coin_response.status_code == 429:
-                        _log(f"    Rate limit hit for {code}. Waiting 61 seconds...")
-                        time.sleep(61)
-                        continue
-                    coin_response.raise_for_status()
-                    coin_data = coin_response.json()
-                    name = coin_data.get('name', code)
-                    icon_url = coin_data.get('image', {}).get('small')
+                    icon_response = self._http.get(icon_url.replace('/large/', '/small/'), stream=True, timeout=10)
+                    icon_response.raise_for_status()
+                    filename = f"{code}.png"
+                    icon_path = os.path.join(ICON_CACHE_DIR, filename)
+                    icon_response.raw.decode_content = True
+                    with open(icon_path, 'wb') as f:
+                        shutil.copyfileobj(icon_response.raw, f, length=65536)
+                except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+                    # Reading response.raw directly surfaces urllib3 errors that requests would have wrapped.
+                    _log(f"    Could not download icon for {code}: {e}.")
+                    if icon_path:
+                        try:
+                            os.remove(icon_path)
+                        except OSError:
+                            pass
                     icon_path = None
-                    if icon_url:
-                        icon_response = requests.get(icon_url, stream=True, timeout=10)
-                        icon_response.raise_for_status()
-                        filename = f"{code}.png"
-                        icon_path = os.path.join(ICON_CACHE_DIR, filename)
-                        with open(icon_path, 'wb') as f:
-                            for chunk in icon_response.iter_content(chunk_size=8192): f.write(chunk)
-                    self.asset_details[code] = {'name': name, 'icon_path': icon_path}
-                    success = True
-                    break
-                except requests.exceptions.RequestException as e:
-                    _log(f"    Attempt {attempt+1}/{max_retries} failed for {code}: {e}. Retrying...")
-                    time.sleep(5 * (attempt + 1))
-            if not success:
-                _log(f"    All attempts failed for {code}. Using fallback data.")
-                self.asset_details[code] = {'name': code, 'icon_path': None}
-        with open(ASSET_DETAILS_FILE, 'wb') as f:
-            pickle.dump(self.asset_details, f)
+            return name, icon_path
+
+        with ThreadPoolExecutor(max_workers=ICON_FETCH_WORKERS) as ex:
+            futures = {ex.submit(_fetch_one, c): c for c in missing_currencies}
+            fetched = 0
+            for i, future in enumerate(as_completed(futures)):
+                code = futures[future]
+                _log(f"  -> Fetched Icon & Name [{i+1}/{len(missing_currencies)}]: {code}")
+                name, icon_path = future.result()
+                with self._asset_lock:
+                    self._asset_name[code], self._asset_icon[code] = name, icon_path
+                if icon_path:
+                    fetched += 1
+                    if fetched % ASSET_CHECKPOINT_EVERY == 0:
+                        self._save_asset_details()
+        self._save_asset_details()
         _log("Asset details cache has been updated.")
 
     def fetch_top_volumes(self, limit=50):
         try:
-            tickers = self.client.fetch_tickers()
-            symbols = [(s, d['quoteVolume']) for s, d in tickers.items() if d.get('quoteVolume') and ':USDT' in s]
-            return [s[0] for s in sorted(symbols, key=lambda x: x[1], reverse=True)[:limit]]
+            if self._tickers_cache is not None and time.monotonic() - self._tickers_cache_time < self._tickers_ttl:
+                tickers = self._tickers_cache
+            else:
+                tickers = self.client.fetch_tickers()
+                self._tickers_cache, self._tickers_cache_time = tickers, time.monotonic()
+            usdt_volumes = ((s, v) for s, d in tickers.items() if s.endswith(':USDT') and (v := d.get('quoteVolume')))
+            top = nlargest(limit, usdt_volumes, key=itemgetter(1))
+            return [s for s, _ in top]
         except Exception as e:
             print(f"Error fetching tickers from KuCoin: {e}")
             return []
 
-    def count_consecutive_candles(self, symbol, timeframe, num_candles=20):
+    @staticmethod
+    def _streak_from_ohlcv(arr):
+        """Returns count, color, and last close price of the trailing streak in an (n, 6) OHLCV array."""
+        if not len(arr):
+            return 0, None, None
+
+        # columns: [timestamp, open, high, low, close, volume]
+        count, direction = _streak_len(np.ascontiguousarray(arr[:, 1]), np.ascontiguousarray(arr[:, 4]))
+        return int(count), 'green' if direction > 0 else 'red', float(arr[-1, 4])
+
+    @staticmethod
+    def _to_ohlcv_array(ohlcv):
+        # reshape keeps an empty response two-dimensional so column slicing still works.
+        return np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+
+    def _fetch_ohlcv_np(self, symbol, timeframe, since, limit):
+        return self._to_ohlcv_array(self.client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit))
+
+    async def _afetch_ohlcv_np(self, async_client, symbol, timeframe, since, limit):
+        return self._to_ohlcv_array(await async_client.fetch_ohlcv(symbol, timeframe, since=since, limit=limit))
+
+    @staticmethod
+    def _closed_candles_since(tf_ms, num_candles, now_ms):
+        """Start of a window holding exactly the last num_candles closed candles."""
+        return (now_ms // tf_ms) * tf_ms - num_candles * tf_ms
+
+    @staticmethod
+    def _drop_open_candle(ohlcv, tf_ms, now_ms):
+        # Timeframes not anchored to the epoch (e.g. KuCoin's Monday-based 1w)
+        # can still return the open candle; drop it by timestamp, not position.
+        if len(ohlcv) and ohlcv[-1, 0] + tf_ms > now_ms:
+            return ohlcv[:-1]
+        return ohlcv
+
+    def _get_cached_ohlcv(self, symbol, timeframe, tf_ms, now_ms):
+        """Returns cached OHLCV for (symbol, timeframe) while no new candle has closed since it was fetched."""
+        entry = self._ohlcv_cache.get((symbol, timeframe))
+        if entry is None:
+            return None
+        fetch_ms, ohlcv = entry
+        # ohlcv[-1] is the last closed candle; once the following one closes the streak can change.
+        if now_ms - fetch_ms < tf_ms // 4 and now_ms < ohlcv[-1, 0] + 2 * tf_ms:
+            return ohlcv
+        return None
+
+    def _store_ohlcv(self, symbol, timeframe, now_ms, ohlcv):
+        if len(ohlcv):
+            self._ohlcv_cache[(symbol, timeframe)] = (now_ms, ohlcv)
+
+    def count_consecutive_candles(self, symbol, timeframe, num_candles=None, min_streak=3, tf_ms=None):
         """Counts consecutive candles and returns count, color, and last close price."""
+        if num_candles is None:
+            num_candles = max(min_streak + 2, STREAK_WINDOW)
         try:
-            since = self.client.milliseconds() - (num_candles * self.client.parse_timeframe(timeframe) * 1000)
-            ohlcv = self.client.fetch_ohlcv(symbol, timeframe, since=since, limit=num_candles)
-            if not ohlcv: 
-                return 0, None, None
-            
-            completed = ohlcv[:-1]
-            if not completed:
-                return 0, None, None
-
-            count = 0
-            last_color = None
-            last_close_price = None
-          
-            for i, candle in enumerate(reversed(completed)):
-                # candle format: [timestamp, open, high, low, close, volume]
-                if i == 0:
-                    last_close_price = candle[4] 
-
-                color = "green" if candle[4] >= candle[1] else "red"
-                if last_color is None or color == last_color:
-                    count += 1
-                    last_color = color
-                else: 
-                    break
-            
-            return count, last_color, last_close_price
+            if tf_ms is None:
+                tf_ms = self.client.parse_timeframe(timeframe) * 1000
+            now_ms = self.client.milliseconds()
+            ohlcv = self._get_cached_ohlcv(symbol, timeframe, tf_ms, now_ms)
+            if ohlcv is None:
+                since = self._closed_candles_since(tf_ms, num_candles, now_ms)
+                ohlcv = self._fetch_ohlcv_np(symbol, timeframe, since, num_candles)
+                ohlcv = self._drop_open_candle(ohlcv, tf_ms, now_ms)
+                self._store_ohlcv(symbol, timeframe, now_ms, ohlcv)
+            return self._streak_from_ohlcv(ohlcv)
         except Exception: 
             return 0, None, None
-            
+
+    async def _acount_consecutive_candles(self, async_client, symbol, timeframe, num_candles=None, min_streak=3, tf_ms=None):
+        """Async counterpart of count_consecutive_candles using a ccxt.async_support client."""
+        if num_candles is None:
+            num_candles = max(min_streak + 2, STREAK_WINDOW)
+        try:
+            if tf_ms is None:
+                tf_ms = async_client.parse_timeframe(timeframe) * 1000
+            now_ms = async_client.milliseconds()
+            ohlcv = self._get_cached_ohlcv(symbol, timeframe, tf_ms, now_ms)
+            if ohlcv is None:
+                since = self._closed_candles_since(tf_ms, num_candles, now_ms)
+                ohlcv = await self._afetch_ohlcv_np(async_client, symbol, timeframe, since, num_candles)
+                ohlcv = self._drop_open_candle(ohlcv, tf_ms, now_ms)
+                self._store_ohlcv(symbol, timeframe, now_ms, ohlcv)
+            return self._streak_from_ohlcv(ohlcv)
+        except Exception:
+            return 0, None, None
+
+    async def _ascan_streaks(self, symbols, timeframes, min_streak_count, progress_callback, _log):
+        async_client = ccxt_async.kucoinfutures({
+            'apiKey': API_KEY, 'secret': API_SECRET, 'password': API_PASSWORD,
+            'enableRateLimit': True,
+        })
+        if self.client.markets:
+            # Share the already loaded markets instead of letting the async client reload them.
+            async_client.set_markets(self.client.markets, self.client.currencies)
+        sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+        tf_table = {tf: self.client.parse_timeframe(tf) * 1000 for tf in timeframes}
+        total_scans = len(symbols) * len(timeframes)
+        current_scan = 0
+        # Report progress for roughly every 5% of symbols instead of each one.
+        log_every = max(1, len(symbols) // 20)
+
+        async def _scan(i, symbol, timeframe):
+            nonlocal current_scan
+            async with sem:
+                if timeframe == timeframes[0] and (i % log_every == 0 or i == len(symbols) - 1):
+                    logger.info("  -> [%d/%d] Analyzing %s...", i + 1, len(symbols), symbol)
+                    _log(f"  -> [{i+1}/{len(symbols)}] Analyzing {symbol}...")
+                result = await self._acount_consecutive_candles(
+                    async_client, symbol, timeframe, min_streak=min_streak_count, tf_ms=tf_table[timeframe]
+                )
+            current_scan += 1
+            if progress_callback: progress_callback(current_scan, total_scans)
+            return result
+
+        try:
+            tasks = [_scan(i, s, tf) for i, s in enumerate(symbols) for tf in timeframes]
+            # gather preserves task order, so results line up with (symbol, timeframe) pairs.
+            results = await asyncio.gather(*tasks)
+        finally:
+            await async_client.close()
+
+        report_data = defaultdict(list)
+        pairs = ((s, tf) for s in symbols for tf in timeframes)
+        for (symbol, timeframe), (count, color, last_price) in zip(pairs, results):
+            if count >= min_streak_count:
+                report_data[timeframe].append((symbol, count, timeframe, color, last_price))
+        for rows in report_data.values():
+            rows.sort(key=itemgetter(1), reverse=True)
+        return report_data
+
     def scan_for_candle_streaks(self, timeframes, top_n_volume=50, min_streak_count=3, progress_callback=None, log_callback=None):
-        """Scans top volume assets for streaks and ensures their metadata is loaded."""
+        """Scans top volume assets for streaks and ensures their metadata is loaded.
+
+        Returns a dict mapping each timeframe to its (symbol, count, timeframe, color,
+        last_price) rows, sorted by streak count; timeframes without streaks are absent.
+
+        OHLCV requests run concurrently (bounded by SCAN_CONCURRENCY) while missing asset
+        metadata is fetched on a worker thread; this stays a blocking call so the CLI and
+        the desktop worker thread can use it unchanged.
+        """
         def _log(message):
             if log_callback: log_callback(message)
         _log("Fetching top volume symbols from KuCoin...")
         symbols = self.fetch_top_volumes(limit=top_n_volume)
         if not symbols:
             _log("Could not fetch top volume symbols. Aborting scan.")
-            return []
-        self.ensure_asset_details_are_loaded(symbols, log_callback)
+            return {}
         _log(f"Scanning {len(symbols)} symbols for candle streaks...")
-        report_data = []
         total_scans = len(symbols) * len(timeframes)
-        current_scan = 0
-        for i, symbol in enumerate(symbols):
-            print(f"  -> [{i+1}/{len(symbols)}] Analyzing {symbol}...")
-            _log(f"  -> [{i+1}/{len(symbols)}] Analyzing {symbol}...")
-            for timeframe in timeframes:
-                current_scan += 1
-                if progress_callback: progress_callback(current_scan, total_scans)
-                
-                count, color, last_price = self.count_consecutive_candles(symbol, timeframe)
-                
-                if count >= min_streak_count:                   
-                    report_data.append((symbol, count, timeframe, color, last_price))
-        
+
+        async def _load_assets():
+            # Names and icons are cosmetic; a failed backfill must not discard the scan results.
+            try:
+                await asyncio.to_thread(self.ensure_asset_details_are_loaded, symbols, log_callback)
+            except Exception as e:
+                logger.warning("Asset details backfill failed: %s", e)
+                _log(f"Warning: Could not update asset details: {e}")
+
+        async def _scan_and_load_assets():
+            # CoinGecko backfill and KuCoin klines hit different APIs, so neither has to wait for the other.
+            report, _ = await asyncio.gather(
+                self._ascan_streaks(symbols, timeframes, min_streak_count, progress_callback, _log),
+                _load_assets(),
+            )
+            return report
+
+        report_data = asyncio.run(_scan_and_load_assets())
         if progress_callback: progress_callback(total_scans, total_scans)
         _log("Scan complete.")
-        return report_data
\ No newline at end of file
+        return report_data
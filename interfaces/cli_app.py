@@ -1,5 +1,6 @@
 # Command-line application to test the core functionality
 
+from operator import itemgetter
 from prettytable import PrettyTable
 from core.kucoin_client import KuCoinClient
 from config.intervals import all_interval, small_interval, big_interval
@@ -41,11 +42,14 @@ def run_cli():
     # You can easily choose which intervals to scan by changing the parameter.
     # Options: all_interval, small_interval, big_interval
     print("\nScanning for assets with significant candle streaks...")
-    interesting_assets = kucoin.scan_for_candle_streaks(
+    results_by_timeframe = kucoin.scan_for_candle_streaks(
         timeframes=all_interval, 
         top_n_volume=50,      # Scan the top 50 coins by volume
         min_streak_count=4    # Report streaks of 4 or more candles
     )
+    # The scan groups rows by timeframe; the report ranks them all together.
+    interesting_assets = sorted((row for rows in results_by_timeframe.values() for row in rows),
+                                key=itemgetter(1), reverse=True)
     
     # 3. Display the results in a table
     display_report(interesting_assets)
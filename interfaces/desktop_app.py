@@ -1,7 +1,18 @@
 ﻿import sys
 import time
 import os
+import gc
+import glob
+import bisect
+import threading
+import logging
 import pickle
+import msgpack
+import numpy as np
+try:
+    import zstandard as zstd
+except ImportError:  # zstandard is optional; the cache is then written as plain msgpack.
+    zstd = None
 from datetime import datetime, timedelta
 import webbrowser
 
@@ -10,8 +21,9 @@ from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QGroupBox, QLineEdit, QStyledItemDelegate, QStyle, QDialog,
                                QTextEdit, QProgressBar, QMessageBox)
 from PySide6.QtCore import (Qt, QAbstractTableModel, QTimer, QThread, Signal,
-                            QObject, QSortFilterProxyModel, QSize, QRect)
-from PySide6.QtGui import QColor, QFont, QPixmap, QPainter, QPalette, QPainterPath
+                            QObject, QSortFilterProxyModel, QSize, QRect, QModelIndex,
+                            QRunnable, QThreadPool)
+from PySide6.QtGui import QColor, QFont, QImage, QPixmap, QPixmapCache, QPainter, QPalette, QTextCursor
 
 try:
     from core.kucoin_client import KuCoinClient
@@ -19,111 +31,258 @@ try:
 except ModuleNotFoundError:
     sys.exit("Error: Run this application using 'python main.py --interface desktop'")
 
-def log_message(message):
-    print(f"[LOG {datetime.now().strftime('%H:%M:%S.%f')[:-3]}] {message}")
+logger = logging.getLogger(__name__)
+# The window traces every refresh step at INFO; only problems reach the console by default.
+# Scan progress is still shown in full in the update log dialog.
+logger.setLevel(logging.WARNING)
 
 CACHE_DIR = 'cache'
-CACHE_FILE = os.path.join(CACHE_DIR, 'scan_results.pkl')
+# One file per timeframe, so a scan only rewrites the timeframes it refreshed.
+CACHE_FILE_PREFIX, CACHE_FILE_SUFFIX = 'scan_results_', '.msgpack'
+CACHE_FILE = os.path.join(CACHE_DIR, CACHE_FILE_PREFIX + '{}' + CACHE_FILE_SUFFIX)
+ZSTD_MAGIC, CACHE_ZSTD_LEVEL = b'\x28\xb5\x2f\xfd', 3
+# Single-file caches written by older versions; read once and migrated to per-timeframe files.
+LEGACY_CACHE_FILES = (os.path.join(CACHE_DIR, 'scan_results.msgpack'), os.path.join(CACHE_DIR, 'scan_results.pkl'))
+PROGRESS_EMIT_INTERVAL, LOG_FLUSH_INTERVAL = 0.05, 0.1  # seconds
+LOG_DIALOG_MAX_LINES = 2000
+SEARCH_DEBOUNCE_MS = 200
+# Scans are scheduled on 15-minute candle boundaries (every larger timeframe closes on one),
+# shortly after the boundary so the exchange has closed the candle.
+SYNC_STEP_MINUTES, SYNC_DELAY_MS = 15, 1000
+# Seconds a tickers snapshot is reused: just under two sync steps, so every other boundary
+# refresh (and any manual or catch-up refresh in between) reuses the previous top-volume list.
+DESKTOP_TICKERS_TTL = (2 * SYNC_STEP_MINUTES - 1) * 60
 TIMEFRAME_DURATIONS = {
     '15m': timedelta(minutes=15), '30m': timedelta(minutes=30), '1h': timedelta(hours=1),
     '2h': timedelta(hours=2), '4h': timedelta(hours=4), '8h': timedelta(hours=8),
     '1d': timedelta(days=1), '1w': timedelta(weeks=1)
 }
-def save_cache(data_dict):
+TIMEFRAME_SECONDS = {tf: td.total_seconds() for tf, td in TIMEFRAME_DURATIONS.items()}
+# Shared Qt value objects for the model and delegate hot paths (QColor is implicitly shared).
+_COLOR_GREEN = QColor("green"); _COLOR_RED = QColor("red"); _COLOR_DARKGREEN = QColor(Qt.GlobalColor.darkGreen)
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter; _ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+_ALIGN_VCENTER = Qt.AlignmentFlag.AlignVCenter
+_NO_PRICE = float('-inf')
+def _pack_entry(entry):
+    packed = msgpack.packb(entry, use_bin_type=True)
+    return zstd.ZstdCompressor(level=CACHE_ZSTD_LEVEL).compress(packed) if zstd else packed
+def _normalize_entry(entry):
+    # Older caches stored a 'timestamp' (datetime, or epoch seconds in msgpack) instead of 'ts'.
+    if 'ts' not in entry:
+        stamp = entry.pop('timestamp', 0)
+        entry['ts'] = stamp.timestamp() if isinstance(stamp, datetime) else float(stamp)
+    return entry
+def _unpack(raw):
+    # Files are zstd frames when zstandard was available at save time, plain msgpack otherwise.
+    if raw[:4] == ZSTD_MAGIC:
+        if zstd is None: raise RuntimeError("file is zstd-compressed but the zstandard package is not installed")
+        raw = zstd.ZstdDecompressor().decompress(raw)
+    # The payload is many small lists; skipping GC passes while unpacking them is noticeably faster.
+    gc.disable()
+    try:
+        return msgpack.unpackb(raw, raw=False)
+    finally:
+        gc.enable()
+def save_cache_entry(timeframe, entry):
+    path = CACHE_FILE.format(timeframe)
     try:
         os.makedirs(CACHE_DIR, exist_ok=True)
-        with open(CACHE_FILE, 'wb') as f: pickle.dump(data_dict, f)
-        log_message(f"Cache saved successfully to {CACHE_FILE}")
-    except Exception as e: log_message(f"Error saving cache: {e}")
+        with open(path + '.tmp', 'wb') as f: f.write(_pack_entry(entry))
+        os.replace(path + '.tmp', path)
+        logger.info("Cache saved successfully to %s", path)
+    except Exception as e: logger.warning("Error saving cache for '%s': %s", timeframe, e)
+def save_cache(data_dict):
+    for timeframe, entry in data_dict.items():
+        save_cache_entry(timeframe, entry)
 def load_cache():
-    if not os.path.exists(CACHE_FILE):
-        log_message("Cache file not found. Returning empty dictionary.")
+    paths = glob.glob(CACHE_FILE.format('*'))
+    if not paths:
+        for legacy_path in LEGACY_CACHE_FILES:
+            if os.path.exists(legacy_path):
+                return _migrate_legacy_cache(legacy_path)
+        logger.info("Cache file not found. Returning empty dictionary.")
         return {}
+    data = {}
+    for path in paths:
+        timeframe = os.path.basename(path)[len(CACHE_FILE_PREFIX):-len(CACHE_FILE_SUFFIX)]
+        try:
+            with open(path, 'rb') as f: data[timeframe] = _normalize_entry(_unpack(f.read()))
+        except Exception as e:
+            logger.warning("Error loading cache file %s: %s. Skipping it.", path, e)
+    logger.info("Cache loaded successfully from %s. Found data for %s timeframes.", CACHE_DIR, list(data))
+    return data
+def _migrate_legacy_cache(legacy_path):
     try:
-        with open(CACHE_FILE, 'rb') as f: data = pickle.load(f)
-        log_message(f"Cache loaded successfully from {CACHE_FILE}. Found data for {list(data.keys())} timeframes.")
-        return data
+        with open(legacy_path, 'rb') as f:
+            data = pickle.load(f) if legacy_path.endswith('.pkl') else _unpack(f.read())
+        for entry in data.values(): _normalize_entry(entry)
     except Exception as e:
-        log_message(f"Error loading cache: {e}. Returning empty dictionary.")
+        logger.warning("Error loading legacy cache: %s. Returning empty dictionary.", e)
         return {}
+    logger.info("Migrating legacy cache %s to per-timeframe files.", legacy_path)
+    save_cache(data)
+    os.remove(legacy_path)
+    return data
+class CacheSaver(QRunnable):
+    """Writes one timeframe's scan results off the UI thread."""
+    def __init__(self, timeframe, entry):
+        super().__init__(); self.timeframe = timeframe; self.entry = entry
+    def run(self):
+        save_cache_entry(self.timeframe, self.entry)
+def _round_icon_image(icon_path, size):
+    """Composes the circular avatar for an icon; QImage painting is safe off the GUI thread."""
+    src = QImage(icon_path).scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+    image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied); image.fill(Qt.GlobalColor.transparent)
+    p = QPainter(image)
+    p.setRenderHint(QPainter.RenderHint.Antialiasing)
+    p.setPen(Qt.PenStyle.NoPen); p.setBrush(Qt.GlobalColor.white)
+    p.drawEllipse(0, 0, size, size)
+    p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+    p.drawImage((size - src.width()) // 2, (size - src.height()) // 2, src)
+    p.end()
+    return image
+class IconPreloadSignals(QObject):
+    loaded = Signal(dict)
+class IconPreloader(QRunnable):
+    def __init__(self, icon_paths, size):
+        super().__init__(); self.icon_paths, self.size = icon_paths, size
+        self.signals = IconPreloadSignals()
+    def run(self):
+        images = {path: _round_icon_image(path, self.size) for path in self.icon_paths if os.path.exists(path)}
+        self.signals.loaded.emit(images)
 class LogDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Update Log"); self.setMinimumSize(600, 400)
         layout = QVBoxLayout(self)
         self.log_text_edit = QTextEdit(); self.log_text_edit.setReadOnly(True)
+        self.log_text_edit.document().setMaximumBlockCount(LOG_DIALOG_MAX_LINES)
         layout.addWidget(self.log_text_edit)
         self.close_button = QPushButton("Close"); self.close_button.clicked.connect(self.accept)
         layout.addWidget(self.close_button)
+        # Lines are collected and inserted together, so the document is laid out once per flush.
+        self._pending = []
+        self._flush_timer = QTimer(self); self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(int(LOG_FLUSH_INTERVAL * 1000))
+        self._flush_timer.timeout.connect(self._flush)
     def append_log(self, message):
-        self.log_text_edit.append(message)
+        self._pending.append(message)
+        if not self._flush_timer.isActive(): self._flush_timer.start()
+    def clear_log(self):
+        self._pending.clear(); self._flush_timer.stop(); self.log_text_edit.clear()
+    def _flush(self):
+        if not self._pending: return
+        text = "\n".join(self._pending); self._pending.clear()
+        if not self.log_text_edit.document().isEmpty(): text = "\n" + text
+        self.log_text_edit.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_text_edit.insertPlainText(text)
         self.log_text_edit.verticalScrollBar().setValue(self.log_text_edit.verticalScrollBar().maximum())
 
 class NameColumnDelegate(QStyledItemDelegate):
+    __slots__ = ('kucoin_client', '_ticker_width_cache')
+    ICON_SIZE = 24
+    _PIXMAP_KEY = 'round-icon:'
     def __init__(self, kucoin_client):
         super().__init__(); self.kucoin_client = kucoin_client
+        # paint() runs for every visible cell on each scroll/hover/sort; keep its text measurements cached.
+        self._ticker_width_cache = {}
+    def store_icons(self, images):
+        """Moves preloaded avatars into QPixmapCache; pixmaps must be created on the GUI thread."""
+        for icon_path, image in images.items():
+            QPixmapCache.insert(self._PIXMAP_KEY + icon_path, QPixmap.fromImage(image))
+    def _round_pixmap(self, icon_path):
+        key = self._PIXMAP_KEY + icon_path
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(_round_icon_image(icon_path, self.ICON_SIZE))
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
     def paint(self, painter, option, index):
         painter.save()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         full_symbol = index.model().data(index, Qt.ItemDataRole.DisplayRole)
-        details = self.kucoin_client.get_asset_details(full_symbol)
-        ticker, full_name = full_symbol.split('/')[0], details['name']
+        ticker, full_name = full_symbol.partition('/')[0], self.kucoin_client.asset_name(full_symbol)
+        icon_path = self.kucoin_client.asset_icon(full_symbol)
         self.initStyleOption(option, index)
         painter.fillRect(option.rect, option.palette.base())
         if option.state & QStyle.StateFlag.State_Selected:
             painter.fillRect(option.rect, option.palette.highlight())
-        padding, icon_size = 5, 24
+        padding, icon_size = 5, self.ICON_SIZE
         icon_rect = QRect(
             option.rect.x() + padding,
             option.rect.y() + (option.rect.height() - icon_size) // 2,
             icon_size,
             icon_size
         )
-        if details.get('icon_path') and os.path.exists(details['icon_path']):
-            pixmap = QPixmap(details['icon_path'])
-            painter.save()
-            path = QPainterPath()
-            path.addEllipse(icon_rect)
-            painter.setClipPath(path)
-            painter.drawPixmap(icon_rect, pixmap)
-            painter.restore()
+        if icon_path is not None:
+            painter.drawPixmap(icon_rect, self._round_pixmap(icon_path))
         x = icon_rect.right() + padding
         font = painter.font()
         font.setBold(True)
         painter.setFont(font)
-        ticker_width = painter.fontMetrics().boundingRect(ticker).width()
-        painter.drawText(x, option.rect.y(), ticker_width, option.rect.height(), Qt.AlignmentFlag.AlignVCenter, ticker)
+        width_key = (ticker, font.family(), font.pointSizeF())
+        ticker_width = self._ticker_width_cache.get(width_key)
+        if ticker_width is None:
+            ticker_width = self._ticker_width_cache[width_key] = painter.fontMetrics().boundingRect(ticker).width()
+        painter.drawText(x, option.rect.y(), ticker_width, option.rect.height(), _ALIGN_VCENTER, ticker)
         x += ticker_width + padding
         font.setBold(False)
         painter.setFont(font)
         painter.setPen(option.palette.color(QPalette.ColorRole.PlaceholderText))
-        painter.drawText(x, option.rect.y(), option.rect.width() - x, option.rect.height(), Qt.AlignmentFlag.AlignVCenter, full_name)
+        painter.drawText(x, option.rect.y(), option.rect.width() - x, option.rect.height(), _ALIGN_VCENTER, full_name)
         painter.restore()
     def sizeHint(self, option, index):
         return QSize(200, 36)
 
 class Worker(QObject):
+    __slots__ = ('kucoin_client', 'timeframes_to_scan', 'progress_emit', 'log_emit',
+                 '_last_progress', '_last_log_flush', '_log_buffer', '_log_lock')
     finished = Signal(dict); progress = Signal(int, int); log = Signal(str)
     def __init__(self, kucoin_client, timeframes_to_scan):
         super().__init__(); self.kucoin_client = kucoin_client; self.timeframes_to_scan = timeframes_to_scan
+        self.progress_emit, self.log_emit = self.progress.emit, self.log.emit
+        self._last_progress = self._last_log_flush = 0.0
+        # The asset backfill logs from its own thread while the scan logs from this one.
+        self._log_buffer, self._log_lock = [], threading.Lock()
+    def _emit_progress(self, current, total):
+        # Each emit is a queued cross-thread call; ~20 updates a second is plenty for a progress bar.
+        now = time.monotonic()
+        if current == total or now - self._last_progress >= PROGRESS_EMIT_INTERVAL:
+            self._last_progress = now; self.progress_emit(current, total)
+    def _buffer_log(self, message):
+        with self._log_lock:
+            self._log_buffer.append(message)
+            if time.monotonic() - self._last_log_flush < LOG_FLUSH_INTERVAL: return
+        self._flush_log()
+    def _flush_log(self):
+        with self._log_lock:
+            batch, self._log_buffer = self._log_buffer, []
+            self._last_log_flush = time.monotonic()
+        if batch: self.log_emit("\n".join(batch))
     def run(self):
-        results_list = self.kucoin_client.scan_for_candle_streaks(
+        results_by_timeframe = self.kucoin_client.scan_for_candle_streaks(
             timeframes=self.timeframes_to_scan, top_n_volume=50, min_streak_count=3,
-            progress_callback=lambda c, t: self.progress.emit(c, t),
-            log_callback=lambda m: self.log.emit(m)
+            progress_callback=self._emit_progress, log_callback=self._buffer_log
         )
-        newly_scanned_results = {}
-        for symbol, count, timeframe, color, last_price in results_list:
-            if timeframe not in newly_scanned_results: newly_scanned_results[timeframe] = []
-            newly_scanned_results[timeframe].append((symbol, count, timeframe, color, last_price))
-        self.finished.emit(newly_scanned_results)
+        self._flush_log()
+        self.finished.emit(results_by_timeframe)
 
 class StreakTableModel(QAbstractTableModel):
+    # Rows are tuples built once in update_data; columns 0-6 hold the display strings,
+    # the remaining slots the sort values and foreground colors looked up by data().
+    __slots__ = ('_data', 'headers', '_prev_keys', '_prev_ranks', '_row_index')
+    _EDIT_INDEX = (7, 8, 2, 2, 9, 10, 6)
+    _FOREGROUND_INDEX = {1: 12, 4: 11, 5: 11}
+    _ALIGNMENT = (_ALIGN_CENTER, _ALIGN_CENTER, _ALIGN_LEFT, _ALIGN_LEFT, _ALIGN_CENTER, _ALIGN_CENTER, _ALIGN_LEFT)
+    _STREAK_COLORS = {'green': _COLOR_DARKGREEN, 'red': _COLOR_RED}
     def __init__(self, data=[]):
         super().__init__()
         self._data = data
         self.headers = ["Rank", "Change", "Name", "Symbol", "Streak Count", "Last Close", "Timeframe"]
-        self.previous_ranks = {}
+        # Previous ranks as key-sorted arrays so the rank diff is one vectorized lookup.
+        self._prev_keys, self._prev_ranks = np.array([], dtype=str), np.array([], dtype=np.int64)
+        self._row_index = {}  # (symbol, timeframe) -> row in self._data
     def rowCount(self, parent=None): return len(self._data)
     def columnCount(self, parent=None): return len(self.headers)
     def headerData(self, section, orientation, role):
@@ -132,82 +291,113 @@ class StreakTableModel(QAbstractTableModel):
     def data(self, index, role):
         if not index.isValid(): return None
         row_data, col = self._data[index.row()], index.column()
-        if role == Qt.ItemDataRole.DisplayRole:
-            if col == 5 and row_data[col] is not None:
-                return f"{row_data[col]:.4f}"
-            return str(row_data[col])
-        if role == Qt.ItemDataRole.EditRole:
-            if col in [0, 4]: return int(row_data[col])
-            if col == 5 and row_data[col] is not None: return float(row_data[col])
-            if col == 1:
-                s = str(row_data[col])
-                if "▲" in s: return int(s.split(" ")[1])
-                elif "▼" in s: return -int(s.split(" ")[1])
-                return 0
-            if col in [2, 3]: return str(row_data[2])
-            return str(row_data[col])
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            if col in [0, 1, 4, 5]: return Qt.AlignmentFlag.AlignCenter
-            return Qt.AlignmentFlag.AlignLeft
+        if role == Qt.ItemDataRole.DisplayRole: return row_data[col]
+        if role == Qt.ItemDataRole.EditRole: return row_data[self._EDIT_INDEX[col]]
+        if role == Qt.ItemDataRole.TextAlignmentRole: return self._ALIGNMENT[col]
         if role == Qt.ItemDataRole.ForegroundRole:
-            if col == 1:
-                s = str(row_data[col])
-                if "▲" in s: return QColor("green")
-                if "▼" in s: return QColor("red")
-            if col in [4, 5]:
-                streak_color = row_data[7]
-                if streak_color == 'green':
-                    return QColor(Qt.GlobalColor.darkGreen)
-                if streak_color == 'red':
-                    return QColor(Qt.GlobalColor.red)
+            slot = self._FOREGROUND_INDEX.get(col)
+            return row_data[slot] if slot is not None else None
         return None
     def update_data(self, new_data):
-        sorted_by_streak = sorted(new_data, key=lambda x: x[1], reverse=True)
-        current_ranks = {item[0] + item[2]: i for i, item in enumerate(sorted_by_streak)}
+        counts = np.fromiter((item[1] for item in new_data), dtype=np.int64, count=len(new_data))
+        order = np.argsort(-counts, kind='stable')
+        sorted_by_streak = [new_data[i] for i in order]
+        keys = np.array([item[0] + item[2] for item in sorted_by_streak], dtype=str)
+        ranks = np.arange(1, len(keys) + 1)
+        if len(self._prev_keys) and len(keys):
+            pos = np.minimum(np.searchsorted(self._prev_keys, keys), len(self._prev_keys) - 1)
+            seen = self._prev_keys[pos] == keys
+            changes = np.where(seen, self._prev_ranks[pos] - ranks, 0)
+        else:
+            seen, changes = np.zeros(len(keys), dtype=bool), np.zeros(len(keys), dtype=np.int64)
+        by_key = np.argsort(keys)
+        self._prev_keys, self._prev_ranks = keys[by_key], ranks[by_key]
         processed_data = []
-        for i, (symbol, count, timeframe, color, last_price) in enumerate(sorted_by_streak):
-            rank, key = i + 1, symbol + timeframe
-            prev_rank, change_str = self.previous_ranks.get(key), "-"
-            if prev_rank is not None:
-                diff = prev_rank - rank
-                if diff > 0: change_str = f"▲ {diff}"
-                elif diff < 0: change_str = f"▼ {-diff}"
-            processed_data.append([rank, change_str, symbol, symbol, count, last_price, timeframe, color])
-        self.previous_ranks = current_ranks
-        self.beginResetModel(); self._data = processed_data; self.endResetModel()
+        for rank, (symbol, count, timeframe, color, last_price), was_seen, change in zip(
+                ranks.tolist(), sorted_by_streak, seen.tolist(), changes.tolist()):
+            change_str, change_color = "-", None
+            if was_seen:
+                if change > 0: change_str, change_color = f"▲ {change}", _COLOR_GREEN
+                elif change < 0: change_str, change_color = f"▼ {-change}", _COLOR_RED
+            price_str = f"{last_price:.4f}" if last_price is not None else "None"
+            processed_data.append((
+                str(rank), change_str, symbol, symbol, str(count), price_str, timeframe,
+                # Missing prices sort below every real one instead of mixing a string into a float column.
+                rank, change, int(count), float(last_price) if last_price is not None else _NO_PRICE,
+                self._STREAK_COLORS.get(color), change_color,
+            ))
+        self._apply_rows(processed_data)
+    def _apply_rows(self, rows):
+        """Applies rows as in-place/insert/remove deltas so views keep their state; resets only on large changes."""
+        new_by_key = {(row[2], row[6]): row for row in rows}
+        removed = [i for key, i in self._row_index.items() if key not in new_by_key]
+        added = [row for key, row in new_by_key.items() if key not in self._row_index]
+        changed = [(i, new_by_key[key]) for key, i in self._row_index.items()
+                   if key in new_by_key and self._data[i] != new_by_key[key]]
+        if len(removed) + len(added) + len(changed) > max(len(self._data), len(rows)) / 2:
+            self.beginResetModel(); self._data = list(new_by_key.values()); self.endResetModel()
+        else:
+            last_col, roles = len(self.headers) - 1, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole, Qt.ItemDataRole.ForegroundRole]
+            for i, row in changed:
+                self._data[i] = row
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_col), roles)
+            for i in sorted(removed, reverse=True):
+                self.beginRemoveRows(QModelIndex(), i, i); del self._data[i]; self.endRemoveRows()
+            if added:
+                first = len(self._data)
+                self.beginInsertRows(QModelIndex(), first, first + len(added) - 1); self._data.extend(added); self.endInsertRows()
+        self._row_index = {(row[2], row[6]): i for i, row in enumerate(self._data)}
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        log_message("MainWindow.__init__() started.")
+        logger.info("MainWindow.__init__() started.")
         self.setWindowTitle("Crypto Trading Tool - Streak Scanner")
         self.setGeometry(100, 100, 1000, 700)
         self.setup_ui()
-        log_message("Initializing KuCoinClient...")
-        self.kucoin_client = KuCoinClient()
-        log_message("KuCoinClient initialized.")
+        logger.info("Initializing KuCoinClient...")
+        # Top-50 by 24h volume barely moves within half an hour; see DESKTOP_TICKERS_TTL.
+        self.kucoin_client = KuCoinClient(tickers_ttl=DESKTOP_TICKERS_TTL)
+        logger.info("KuCoinClient initialized.")
         self.source_model = StreakTableModel()
         self.proxy_model = QSortFilterProxyModel(); self.proxy_model.setSourceModel(self.source_model)
         self.proxy_model.setSortRole(Qt.ItemDataRole.EditRole); self.proxy_model.setFilterKeyColumn(3)
         self.proxy_model.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.table_view.setModel(self.proxy_model)
-        self.table_view.setItemDelegateForColumn(2, NameColumnDelegate(self.kucoin_client))
+        self.name_delegate = NameColumnDelegate(self.kucoin_client)
+        self.table_view.setItemDelegateForColumn(2, self.name_delegate)
+        # Decode the known icons in the background so the first paint of the table doesn't hit the disk.
+        QPixmapCache.setCacheLimit(10 * 1024)
+        self.icon_preloader = IconPreloader(self.kucoin_client.asset_icon_paths(), NameColumnDelegate.ICON_SIZE)
+        self.icon_preloader.setAutoDelete(False)
+        self.icon_preloader.signals.loaded.connect(self.name_delegate.store_icons)
+        QThreadPool.globalInstance().start(self.icon_preloader)
         self.setup_table_style()
         self.worker_thread = None; self.worker = None; self.update_start_time = None
-        self.current_filter = all_interval
-        log_message("Loading initial data from cache...")
+        self.filter_intervals = {'all': all_interval, 'small': small_interval, 'big': big_interval}
+        self.current_filter = 'all'
+        logger.info("Loading initial data from cache...")
         self.cached_results = load_cache()
+        # Rows per filter, kept sorted by streak count so a filter switch is just a model update.
+        self._by_filter = {name: [] for name in self.filter_intervals}
+        for timeframe, entry in self.cached_results.items(): self._index_timeframe(timeframe, entry.get('data', []))
+        # A single thread keeps cache writes ordered, so an older save never lands after a newer one.
+        self.cache_pool = QThreadPool(self); self.cache_pool.setMaxThreadCount(1)
         self.log_dialog = LogDialog(self)
         self.setup_connections()
-        self.sync_timer = QTimer(self); self.sync_timer.setInterval(60 * 1000)
-        self.sync_timer.timeout.connect(self.check_sync_point)
-        log_message("Performing initial display from cache...")
+        self.sync_timer = QTimer(self); self.sync_timer.setSingleShot(True)
+        # A coarse timer may be off by ~5% of a 15-minute interval, enough to miss the boundary.
+        self.sync_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.sync_timer.timeout.connect(self._on_sync_boundary)
+        self._next_sync = None
+        self._due_timeframes = set()  # timeframes whose candle closed at a boundary, until a scan picks them up
+        logger.info("Performing initial display from cache...")
         self._display_from_cache()
-        log_message("Triggering initial data scan on startup.")
+        logger.info("Triggering initial data scan on startup.")
         self.manual_refresh()
-        log_message("Starting sync timer for subsequent updates.")
-        self.sync_timer.start()
-        log_message("MainWindow.__init__() finished.")
+        logger.info("Starting sync timer for subsequent updates.")
+        self._schedule_next_sync()
+        logger.info("MainWindow.__init__() finished.")
 
     def setup_ui(self):
         self.central_widget = QWidget(); self.setCentralWidget(self.central_widget)
@@ -228,7 +418,10 @@ class MainWindow(QMainWindow):
         self.layout.addWidget(self.refresh_button); self.layout.addWidget(self.table_view)
     def setup_connections(self):
         self.radio_all.toggled.connect(self._on_filter_changed); self.radio_small.toggled.connect(self._on_filter_changed); self.radio_big.toggled.connect(self._on_filter_changed)
-        self.search_bar.textChanged.connect(self.proxy_model.setFilterFixedString)
+        # Re-filter once typing pauses instead of on every keystroke.
+        self.search_timer = QTimer(self); self.search_timer.setSingleShot(True); self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(lambda: self.proxy_model.setFilterFixedString(self.search_bar.text()))
+        self.search_bar.textChanged.connect(self.search_timer.start)
         self.refresh_button.clicked.connect(self.manual_refresh)
         self.log_button.clicked.connect(self.log_dialog.show)
         self.table_view.clicked.connect(self.on_row_clicked)
@@ -276,101 +469,118 @@ class MainWindow(QMainWindow):
                 # Construir la URL completa
                 url = f"https://www.kucoin.com/trade/futures/{url_symbol}"
                 
-                log_message(f"Abriendo navegador en la URL: {url}")
+                logger.info("Abriendo navegador en la URL: %s", url)
                 webbrowser.open(url) # Abrir la URL en el navegador por defecto
             except Exception as e:
-                log_message(f"Error al construir la URL para '{symbol_text}': {e}")
+                logger.warning("Error al construir la URL para '%s': %s", symbol_text, e)
                 # Opcional: Mostrar un mensaje de error al usuario
                 QMessageBox.critical(self, "Error", "No se pudo generar la URL de trading.")
         else:
-            log_message("Acción de trade cancelada por el usuario.")
+            logger.info("Acción de trade cancelada por el usuario.")
 
-    def check_sync_point(self):
+    def _schedule_next_sync(self):
         now = datetime.now()
-        log_message(f"check_sync_point() called by timer at {now.strftime('%H:%M:%S')}.")
+        self._next_sync = now.replace(second=0, microsecond=0) + timedelta(minutes=SYNC_STEP_MINUTES - now.minute % SYNC_STEP_MINUTES)
+        self.sync_timer.start(int((self._next_sync - now).total_seconds() * 1000) + SYNC_DELAY_MS)
+    def _on_sync_boundary(self):
+        logger.info("Sync boundary %s reached.", self._next_sync.strftime('%H:%M'))
+        self._due_timeframes.update(self._get_current_sync_timeframes(self._next_sync))
         self.manual_refresh()
+        self._schedule_next_sync()
     def manual_refresh(self):
-        log_message("manual_refresh() triggered.")
+        logger.info("manual_refresh() triggered.")
         if self.worker_thread and self.worker_thread.isRunning():
-            log_message("Refresh is already in progress. Skipping request.")
+            logger.info("Refresh is already in progress. Skipping request.")
             return
-        log_message("Checking for stale timeframes...")
+        logger.info("Checking for stale timeframes...")
         timeframes = self._get_stale_timeframes()
         if not timeframes:
-            log_message("Cache is up to date. Nothing to refresh.")
+            logger.info("Cache is up to date. Nothing to refresh.")
             self.last_updated_label.setText(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (Up to date)")
             return
-        log_message(f"Found {len(timeframes)} stale timeframes to scan: {timeframes}")
-        self.log_dialog.log_text_edit.clear()
+        logger.info("Found %d stale timeframes to scan: %s", len(timeframes), timeframes)
+        self._due_timeframes.clear()
+        self.log_dialog.clear_log()
         self.progress_bar.setVisible(True); self.progress_bar.setValue(0)
         self.refresh_button.setEnabled(False); self.refresh_button.setText("Refreshing...")
         self.update_start_time = time.perf_counter()
-        log_message("Setting up new Worker and QThread.")
+        logger.info("Setting up new Worker and QThread.")
         self.worker_thread = QThread()
         self.worker = Worker(self.kucoin_client, timeframes)
         self.worker.moveToThread(self.worker_thread)
         self.worker_thread.started.connect(self.worker.run)
-        self.worker.log.connect(self.log_dialog.append_log); self.worker.log.connect(log_message)
+        self.worker.log.connect(self.log_dialog.append_log); self.worker.log.connect(logger.info)
         self.worker.progress.connect(lambda c, t: self.progress_bar.setValue(int(c/t * 100) if t > 0 else 0))
         self.worker.finished.connect(self.on_scan_complete)
         self.worker.finished.connect(self.worker_thread.quit)
         self.worker.finished.connect(self.worker.deleteLater)
         self.worker_thread.finished.connect(self.worker_thread.deleteLater)
         self.worker_thread.finished.connect(self.cleanup_thread_references)
-        log_message("Starting worker thread...")
+        logger.info("Starting worker thread...")
         self.worker_thread.start()
     def on_scan_complete(self, new_data_dict):
-        log_message("on_scan_complete() slot triggered.")
+        logger.info("on_scan_complete() slot triggered.")
         if self.update_start_time:
             duration = time.perf_counter() - self.update_start_time
-            log_message(f"Scan took {duration:.2f} seconds.")
+            logger.info("Scan took %.2f seconds.", duration)
             self.update_duration_label.setText(f"Duration: {duration:.2f}s")
         now = datetime.now()
         for timeframe, data_list in new_data_dict.items():
-            log_message(f"Updating cache for timeframe '{timeframe}' with {len(data_list)} items.")
-            self.cached_results[timeframe] = {'timestamp': now, 'data': data_list}
-        save_cache(self.cached_results)
+            logger.info("Updating cache for timeframe '%s' with %d items.", timeframe, len(data_list))
+            self.cached_results[timeframe] = {'ts': now.timestamp(), 'data': data_list}
+            self._index_timeframe(timeframe, data_list)
+        for timeframe in new_data_dict:
+            self.cache_pool.start(CacheSaver(timeframe, self.cached_results[timeframe]))
         self._display_from_cache()
         self.last_updated_label.setText(f"Last Updated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
         self.refresh_button.setEnabled(True); self.refresh_button.setText("Refresh Now")
         self.progress_bar.setVisible(False)
     def cleanup_thread_references(self):
-        log_message("Cleaning up worker and thread references.")
+        logger.info("Cleaning up worker and thread references.")
         self.worker, self.worker_thread = None, None
+        # A boundary that fired during the scan left its timeframes due; pick them up right away.
+        if self._due_timeframes:
+            logger.info("Timeframes became due during the scan: %s", sorted(self._due_timeframes))
+            QTimer.singleShot(0, self.manual_refresh)
     def _get_stale_timeframes(self):
-        stale, now = set(), datetime.now()
-        for tf in all_interval:
-            if tf not in self.cached_results:
-                stale.add(tf)
+        stale = set(all_interval) - self.cached_results.keys()
+        now_ts = time.time()
         for tf, entry in self.cached_results.items():
-            if now - entry.get('timestamp', datetime.min) >= TIMEFRAME_DURATIONS.get(tf, timedelta(0)):
+            if now_ts - entry.get('ts', 0.0) >= TIMEFRAME_SECONDS.get(tf, 0.0):
                 stale.add(tf)
-        stale.update(self._get_current_sync_timeframes(now))
+        stale.update(self._due_timeframes)
         return list(stale)
-    def _get_current_sync_timeframes(self, now):
+    def _get_current_sync_timeframes(self, boundary):
         tfs = set()
-        minute = now.minute
-        if minute % 15 == 1: tfs.add('15m')
-        if minute % 30 == 1: tfs.add('30m')
-        if minute == 1: tfs.update(['1h', '2h', '4h', '8h', '1d', '1w'])
+        minute = boundary.minute
+        if minute % 15 == 0: tfs.add('15m')
+        if minute % 30 == 0: tfs.add('30m')
+        if minute == 0: tfs.update(['1h', '2h', '4h', '8h', '1d', '1w'])
         return list(tfs)
+    def _index_timeframe(self, timeframe, data_list):
+        """Replaces the rows of one timeframe in every filter list that includes it."""
+        for name, intervals in self.filter_intervals.items():
+            if timeframe not in intervals: continue
+            rows = [row for row in self._by_filter[name] if row[2] != timeframe]
+            for row in data_list: bisect.insort(rows, row, key=lambda r: -r[1])
+            self._by_filter[name] = rows
     def _on_filter_changed(self):
-        log_message("Filter changed.")
-        if self.radio_small.isChecked(): self.current_filter = small_interval
-        elif self.radio_big.isChecked(): self.current_filter = big_interval
-        else: self.current_filter = all_interval
+        logger.info("Filter changed.")
+        if self.radio_small.isChecked(): self.current_filter = 'small'
+        elif self.radio_big.isChecked(): self.current_filter = 'big'
+        else: self.current_filter = 'all'
         self._display_from_cache()
     def _display_from_cache(self):
-        log_message("Displaying data from cache...")
-        items = []
-        for tf, entry in self.cached_results.items():
-            if tf in self.current_filter:
-                items.extend(entry.get('data', []))
-        log_message(f"Found {len(items)} items matching current filter to display.")
+        logger.info("Displaying data from cache...")
+        items = self._by_filter[self.current_filter]
+        logger.info("Found %d items matching current filter to display.", len(items))
+        # Apply the row deltas first and let the proxy re-sort once, not after each change.
+        self.proxy_model.setDynamicSortFilter(False)
         self.source_model.update_data(items)
+        self.proxy_model.setDynamicSortFilter(True)
     def closeEvent(self, event):
-        log_message("Close event detected. Saving cache before exiting.")
-        save_cache(self.cached_results)
+        logger.info("Close event detected. Waiting for pending cache saves before exiting.")
+        self.cache_pool.waitForDone()
         event.accept()
 
 def run_desktop():
@@ -5,6 +5,10 @@
 # Main entry point for the entire application.
 
 import sys
+import atexit
+import logging
+import logging.handlers
+import queue
 
 # We will import the different application interfaces here
 from interfaces.cli_app import run_cli
@@ -12,11 +16,26 @@ from interfaces.desktop_app import run_desktop
 # from interfaces.telegram_bot import run_bot # Example for the future
 # from interfaces.web_app import run_web # Example for the future
 
+def setup_logging():
+    """
+    Routes all log records through a queue so that worker threads never block on console I/O.
+    """
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
 def main():
     """
     Determines which interface to run based on command-line arguments.
     """
     print("--- Crypto Trading Tool ---")
+    setup_logging()
     
     # Check for command-line arguments
     if len(sys.argv) > 1 and sys.argv[1] == '--interface':